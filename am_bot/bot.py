@@ -1,21 +1,25 @@
+import importlib
 import logging
 
 import discord
 from discord.ext.commands import Bot
 
-from .cogs.greetings import GreetingsCog
-from .cogs.invite_response import InviteResponseCog
-from .cogs.responses import ResponsesCog
-from .cogs.role_assignment import RoleAssignmentCog
-from .cogs.server_stats import ServerStatsCog
-from .cogs.workshop import WorkshopCog
-
 
 logger = logging.getLogger(__name__)
 intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
 
+# (module, cog class, whether the cog takes the bot) imported on demand
+_COG_SPECS = (
+    ("greetings", "GreetingsCog", False),
+    ("invite_response", "InviteResponseCog", True),
+    ("responses", "ResponsesCog", True),
+    ("role_assignment", "RoleAssignmentCog", True),
+    ("server_stats", "ServerStatsCog", True),
+    ("workshop", "WorkshopCog", True),
+)
+
 
 class ARKBot(Bot):
     def __init__(self, command_prefix, **kwargs):
@@ -24,20 +28,27 @@ class ARKBot(Bot):
         )
 
     async def on_ready(self):
-        logger.info(f"Logged on as {self.user}!")
+        logger.info("Logged on as %s!", self.user)
         logger.info("Starting Tasks...")
         await self.add_cogs()
 
     async def on_message(self, message):
-        logger.info(f"Message from {message.author}: {message.content}")
+        logger.info("Message from %s: %s", message.author, message.content)
         if message.author.id == self.user.id:
             return
+        prefix = self.command_prefix
+        # Callable prefixes are resolved by process_commands
+        if not callable(prefix):
+            if not isinstance(prefix, str):
+                prefix = tuple(prefix)
+            if not message.content.startswith(prefix):
+                return
         await self.process_commands(message)
 
     async def add_cogs(self):
-        await self.add_cog(GreetingsCog())
-        await self.add_cog(InviteResponseCog(self))
-        await self.add_cog(ResponsesCog(self))
-        await self.add_cog(RoleAssignmentCog(self))
-        await self.add_cog(ServerStatsCog(self))
-        await self.add_cog(WorkshopCog(self))
+        for module_name, cog_name, takes_bot in _COG_SPECS:
+            module = importlib.import_module(
+                f".cogs.{module_name}", __package__
+            )
+            cog = getattr(module, cog_name)
+            await self.add_cog(cog(self) if takes_bot else cog())
@@ -9,11 +9,11 @@ logger = logging.getLogger(__name__)
 
 class GreetingsCog(commands.Cog):
     def __init__(self):
-        self._last_member = None
+        self._last_member_id = None
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        logger.debug(f"Member joined guild: {member}")
+        logger.debug("Member joined guild: %s", member)
         channel = member.guild.system_channel
         if channel is not None:
             await channel.send(f"Welcome {member.mention}!")
@@ -23,8 +23,8 @@ class GreetingsCog(commands.Cog):
         """Says Hello"""
         logger.debug("HELLO")
         member = member or ctx.author
-        if self._last_member is None or self._last_member.id != member.id:
+        if self._last_member_id != member.id:
             await ctx.send(f"Hello {member.name}.")
         else:
             await ctx.send(f"Hello {member.name}... This feels familiar.")
-        self._last_member = member
+        self._last_member_id = member.id
@@ -1,28 +1,78 @@
+import collections
 import logging
 import re
+import string
 
 import discord
 from discord.ext import commands
 
 from ..constants import INVITE_HELP_TEXT_CHANNEL_ID
-from ..ses import send_email
+from ..ses import send_email_async
 
 
 logger = logging.getLogger(__name__)
+REFERENCED_CACHE_SIZE = 256
+_EMAIL_RE = re.compile(r"Email: (.*)")
+_BODY_TXT_TEMPLATE = string.Template(
+    "Your Message: $help_request\n\n"
+    "ARK Modding Discord Staff Response:\n\n"
+    "$author: $content"
+)
+_BODY_HTML_TEMPLATE = string.Template(
+    """
+        <html>
+        <head>
+            <style>
+                body {
+                    font-family: Helvetica, Arial, sans-serif;
+                }
+                pre {
+                    white-space: pre-wrap;       /* css-3 */
+                    white-space: -moz-pre-wrap;  /* Mozilla, since 1999 */
+                    white-space: -pre-wrap;      /* Opera 4-6 */
+                    white-space: -o-pre-wrap;    /* Opera 7 */
+                    word-wrap: break-word;       /* Internet Explorer 5.5+ */
+                    background-color:  ccc;
+                    border: 1px solid black;
+                    border-radius: 3px;
+                    padding: 3px;
+                }
+                #moderator-name {
+                    color:  red;
+                    font-weight: bold;
+                }
+            </style>
+        </head>
+        <body>
+            <h1>ARK Modding Discord Staff Response</h1>
+            <pre>$help_request</pre>
+            <h4>Staff Response</h4>
+            <p><span id="moderator-name">$author</span>:
+            $content
+            </p>
+        </body>
+        </html>
+        """
+)
 
 
 class InviteResponseCog(commands.Cog):
     def __init__(self, bot: discord.ext.commands.Bot):
         self.bot = bot
+        self._self_id = None
+        self._referenced_cache = collections.OrderedDict()
+
+    def cog_load(self) -> None:
+        # Cogs are added after login, so the bot user is available here
+        self._self_id = self.bot.user.id
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        logger.debug("Message Received")
-        if message.author.id == self.bot.user.id:
-            logger.debug("Message is from self, ignore.")
-            return
         if message.channel.id != INVITE_HELP_TEXT_CHANNEL_ID:
-            logger.debug("Message is not in Invite Help channel, ignore.")
+            return
+        logger.debug("Message Received from %s", message.author)
+        if message.author.id == self._self_id:
+            logger.debug("Message is from self, ignore.")
             return
         if (
             message.reference is None
@@ -36,60 +86,58 @@ class InviteResponseCog(commands.Cog):
         referenced: discord.Message = (
             message.reference.resolved
             if message.reference.resolved is not None
-            else await message.channel.fetch_message(
-                message.reference.message_id
+            else await self._fetch_referenced(
+                message.channel, message.reference.message_id
             )
         )
 
         logger.warning(referenced.content)
-        email_pattern = re.compile(r"Email: (.*)")
-        match = email_pattern.match(referenced.content)
+        match = _EMAIL_RE.match(referenced.content)
         if not match:
             logger.debug("Email not found in referenced message.")
-        logger.debug(f"Email found for referenced message: {match.group(1)}")
-        help_request = "\n".join(referenced.content.split("\n")[7:])
-        body_txt = (
-            f"Your Message: {help_request}\n\n"
-            f"ARK Modding Discord Staff Response:\n\n"
-            f"{message.author.display_name}: {message.content}"
+        logger.debug("Email found for referenced message: %s", match.group(1))
+        parts = referenced.content.split("\n", 7)
+        help_request = parts[7] if len(parts) > 7 else ""
+        body_txt = _BODY_TXT_TEMPLATE.substitute(
+            help_request=help_request,
+            author=message.author.display_name,
+            content=message.content,
         )
-        body_html = f"""
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: Helvetica, Arial, sans-serif;
-                }}
-                pre {{
-                    white-space: pre-wrap;       /* css-3 */
-                    white-space: -moz-pre-wrap;  /* Mozilla, since 1999 */
-                    white-space: -pre-wrap;      /* Opera 4-6 */
-                    white-space: -o-pre-wrap;    /* Opera 7 */
-                    word-wrap: break-word;       /* Internet Explorer 5.5+ */
-                    background-color:  ccc;
-                    border: 1px solid black;
-                    border-radius: 3px;
-                    padding: 3px;
-                }}
-                #moderator-name {{
-                    color:  red;
-                    font-weight: bold;
-                }}
-            </style>
-        </head>
-        <body>
-            <h1>ARK Modding Discord Staff Response</h1>
-            <pre>{help_request}</pre>
-            <h4>Staff Response</h4>
-            <p><span id="moderator-name">{message.author.display_name}</span>:
-            {message.content}
-            </p>
-        </body>
-        </html>
-        """
-        send_email(
-            match.group(1),
+        body_html = _BODY_HTML_TEMPLATE.substitute(
+            help_request=help_request,
+            author=message.author.display_name,
+            content=message.content,
+        )
+        await send_email_async(
+            to=match.group(1),
             subject="ARK Modding Discord Staff Response",
             body_txt=body_txt,
             body_html=body_html,
         )
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(
+        self, payload: discord.RawMessageDeleteEvent
+    ):
+        # Fetched messages aren't in the connection's message cache, so only
+        # the raw event fires for them
+        self._referenced_cache.pop(payload.message_id, None)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(
+        self, payload: discord.RawMessageUpdateEvent
+    ):
+        # The Email line may have changed, so fetch it again on next reply
+        self._referenced_cache.pop(payload.message_id, None)
+
+    async def _fetch_referenced(
+        self, channel: discord.TextChannel, message_id: int
+    ) -> discord.Message:
+        if message_id in self._referenced_cache:
+            self._referenced_cache.move_to_end(message_id)
+            return self._referenced_cache[message_id]
+        referenced = await channel.fetch_message(message_id)
+        self._referenced_cache[message_id] = referenced
+        if len(self._referenced_cache) > REFERENCED_CACHE_SIZE:
+            self._referenced_cache.popitem(last=False)
+        return referenced
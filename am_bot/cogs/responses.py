@@ -7,12 +7,27 @@ from discord.ext import commands
 
 
 logger = logging.getLogger(__name__)
-COMMANDS = json.load(
-    open(
-        pathlib.Path(__file__).parent.resolve() / "command_responses.json",
-        "rb",
-    )
+COMMANDS = json.loads(
+    (pathlib.Path(__file__).parent / "command_responses.json").read_bytes()
 )
+PREFIXES = frozenset(COMMANDS)
+# Full trigger (prefix + name) -> command, with `duplicate` entries
+# already pointing at the original they duplicate
+FLAT_COMMANDS = {
+    f"{prefix}{name}": (
+        prefix_commands[command["duplicate"]]
+        if "duplicate" in command
+        else command
+    )
+    for prefix, prefix_commands in COMMANDS.items()
+    for name, command in prefix_commands.items()
+}
+# Embeds are only read when sending, so they are built once and reused
+EMBEDS = {
+    trigger: discord.Embed.from_dict(command["embed"])
+    for trigger, command in FLAT_COMMANDS.items()
+    if "embed" in command
+}
 
 
 class ResponsesCog(commands.Cog):
@@ -28,26 +43,16 @@ class ResponsesCog(commands.Cog):
         if not message.content:
             logger.debug("No Message Content. Ignoring.")
             return
-        logger.debug(
-            f"First Char: {message.content[0]}, "
-            f"Remaining Chars: {message.content[1:]}"
-        )
-        if (
-            message.content[0] in COMMANDS
-            and message.content[1:] in COMMANDS[message.content[0]]
-        ):
-            logger.debug(f"Valid Response Command: {message.content}")
-            command = COMMANDS[message.content[0]][message.content[1:]]
-            logger.debug(f"Command: {command}")
-            if "duplicate" in command:
-                # Handle duplicate commands,
-                # grab original defined by `duplicate`
-                command = COMMANDS[message.content[0]][command["duplicate"]]
-            if "embed" in command:
-                logger.debug("Embed Response")
-                await message.channel.send(
-                    embed=discord.Embed.from_dict(command["embed"])
-                )
-            elif "content" in command:
-                logger.debug("Content Response")
-                await message.channel.send(content=command["content"])
+        if message.content[0] not in PREFIXES:
+            return
+        command = FLAT_COMMANDS.get(message.content)
+        if command is None:
+            return
+        logger.debug(f"Valid Response Command: {message.content}")
+        logger.debug(f"Command: {command}")
+        if "embed" in command:
+            logger.debug("Embed Response")
+            await message.channel.send(embed=EMBEDS[message.content])
+        elif "content" in command:
+            logger.debug("Content Response")
+            await message.channel.send(content=command["content"])
@@ -2,22 +2,43 @@ import asyncio
 import json
 import logging
 import pathlib
+from typing import NamedTuple, Optional
 
 import discord
 from discord.ext import commands
 
 
 logger = logging.getLogger(__name__)
-ASSIGNABLE_ROLES = json.load(
-    open(
-        pathlib.Path(__file__).parent.resolve() / "assignable_roles.json", "rb"
+
+
+class AssignableRole(NamedTuple):
+    name: str
+    channel_id: int
+    role_id: int
+    message_id: int
+    # Set for custom emoji only
+    emoji_id: Optional[int] = None
+
+
+ASSIGNABLE_ROLES = {
+    emoji: AssignableRole(**role_details)
+    for emoji, role_details in json.loads(
+        (pathlib.Path(__file__).parent / "assignable_roles.json").read_bytes()
+    ).items()
+}
+# (channel ID, message ID) -> [(emoji, role details), ...] for each message
+# holding reaction roles
+ROLE_MESSAGES = {}
+for _emoji, _role in ASSIGNABLE_ROLES.items():
+    ROLE_MESSAGES.setdefault((_role.channel_id, _role.message_id), []).append(
+        (_emoji, _role)
     )
-)
 
 
 class RoleAssignmentCog(commands.Cog):
     def __init__(self, bot: discord.ext.commands.Bot):
         self.bot = bot
+        self._role_messages = {}
 
     def cog_load(self) -> None:
         self.bot.loop.create_task(self.reset_reactions())
@@ -31,96 +52,88 @@ class RoleAssignmentCog(commands.Cog):
             logger.debug("Reaction from self. Ignore")
             return
         logger.debug(f"Reaction ADD Received. Payload: {payload}")
-        if payload.emoji.name not in ASSIGNABLE_ROLES:
+        role = ASSIGNABLE_ROLES.get(payload.emoji.name)
+        if role is None:
             logger.debug("Emoji not in ASSIGNABLE_ROLES. Skipping.")
             return
-        emoji = payload.emoji.name
-        if (
-            "message_id" in ASSIGNABLE_ROLES[emoji]
-            and payload.message_id != ASSIGNABLE_ROLES[emoji]["message_id"]
-        ):
+        if payload.message_id != role.message_id:
             logger.debug("Wrong Channel")
             return
-        # Add Role (no need to check)
-        logger.info(
-            f'Adding {ASSIGNABLE_ROLES[emoji]["name"]} '
-            f"Role to {payload.member}"
-        )
+        # Add Role, reactions are reset regularly so members often have it
+        if payload.member.get_role(role.role_id) is not None:
+            logger.debug(f"{payload.member} already has {role.name} Role.")
+            return
+        logger.info(f"Adding {role.name} Role to {payload.member}")
         await payload.member.add_roles(
-            payload.member.guild.get_role(ASSIGNABLE_ROLES[emoji]["role_id"])
+            payload.member.guild.get_role(role.role_id)
         )
-        if ASSIGNABLE_ROLES[emoji]["name"] in ["Modder", "Mapper"]:
-            server_stats_cog = self.bot.get_cog("ServerStatsCog")
-            if server_stats_cog:
-                await server_stats_cog.update_role_counts()
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
         """Remove role"""
         logger.debug(f"Reaction REMOVE Received. Payload {payload}")
-        if payload.emoji.name not in ASSIGNABLE_ROLES:
+        role = ASSIGNABLE_ROLES.get(payload.emoji.name)
+        if role is None:
             logger.debug("Emoji not in ASSIGNABLE_ROLES. Skipping.")
             return
-        emoji = payload.emoji.name
-        if (
-            "message_id" in ASSIGNABLE_ROLES[emoji]
-            and payload.message_id != ASSIGNABLE_ROLES[emoji]["message_id"]
-        ):
+        if payload.message_id != role.message_id:
             logger.debug("Wrong Channel")
             return
 
         # Remove Role
-        guild = await self.bot.fetch_guild(payload.guild_id)
-        member = await guild.fetch_member(payload.user_id)
-        logger.info(
-            f'Removing {ASSIGNABLE_ROLES[emoji]["name"]} Role from {member}.'
-        )
-        await member.remove_roles(
-            guild.get_role(ASSIGNABLE_ROLES[emoji]["role_id"])
+        # Members intent keeps these cached, only fall back to the API
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is None:
+            logger.debug("Guild not cached. Skipping.")
+            return
+        member = guild.get_member(payload.user_id) or await guild.fetch_member(
+            payload.user_id
         )
-        if ASSIGNABLE_ROLES[emoji]["name"] in ["Modder", "Mapper"]:
-            server_stats_cog = self.bot.get_cog("ServerStatsCog")
-            if server_stats_cog:
-                await server_stats_cog.update_role_counts()
+        if member.get_role(role.role_id) is None:
+            logger.debug(f"{member} does not have {role.name} Role.")
+            return
+        logger.info(f"Removing {role.name} Role from {member}.")
+        await member.remove_roles(guild.get_role(role.role_id))
 
     async def reset_reactions(self):
         await asyncio.sleep(10)
         while True:
             logger.debug("Resetting reactions for Reaction Roles...")
-            cleared_messages = []
-            for emoji, role_details in ASSIGNABLE_ROLES.items():
-                logger.debug(f"Resetting Emoji: {emoji}")
-                channel = self.bot.get_channel(role_details["channel_id"])
-                message = await channel.fetch_message(
-                    role_details["message_id"]
+            await asyncio.gather(
+                *(
+                    self.reset_message_reactions(*ids, roles)
+                    for ids, roles in ROLE_MESSAGES.items()
                 )
-                # Check if we have already reset reactions
-                # for this message, if not, clear them
-                if role_details["message_id"] not in cleared_messages:
-                    logger.debug(
-                        f'Message ID {role_details["message_id"]} has not '
-                        f"been reset. Resetting..."
-                    )
-                    await message.clear_reactions()
-                    cleared_messages.append(role_details["message_id"])
-                # Add first reaction with this emoji.
-                if "emoji_id" in role_details:
-                    # Custom Emoji
-                    logger.debug(
-                        f"Adding custom Emoji Reaction {emoji} to Message ID "
-                        f'{role_details["message_id"]}'
-                    )
-                    await message.add_reaction(
-                        self.bot.get_emoji(role_details["emoji_id"])
-                    )
-                else:
-                    # Unicode Emoji
-                    logger.debug(
-                        f"Adding Unicode Emoji Reaction {emoji} to Message ID "
-                        f'{role_details["message_id"]}'
-                    )
-                    await message.add_reaction(emoji)
+            )
             logger.debug(
                 "Finished Reaction Role Reset. Sleeping 10 minutes..."
             )
             await asyncio.sleep(600)
+
+    async def reset_message_reactions(self, channel_id, message_id, roles):
+        message = self._role_messages.get(message_id)
+        if message is None:
+            channel = self.bot.get_channel(channel_id)
+            message = await channel.fetch_message(message_id)
+            # Only the message ID is needed to edit reactions, so the
+            # fetched message can be reused on every reset.
+            self._role_messages[message_id] = message
+        logger.debug(f"Resetting reactions for Message ID {message_id}...")
+        await message.clear_reactions()
+        # Add first reaction with each emoji. These stay sequential so the
+        # reactions show up in the order they are configured.
+        for emoji, role in roles:
+            if role.emoji_id is not None:
+                # Custom Emoji
+                logger.debug(
+                    f"Adding custom Emoji Reaction {emoji} to Message ID "
+                    f"{message_id}"
+                )
+                await message.add_reaction(self.bot.get_emoji(role.emoji_id))
+            else:
+                # Unicode Emoji
+                logger.debug(
+                    f"Adding Unicode Emoji Reaction {emoji} to Message ID "
+                    f"{message_id}"
+                )
+                await message.add_reaction(emoji)
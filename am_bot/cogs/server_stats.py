@@ -16,75 +16,142 @@ from ..constants import (
 
 
 logger = logging.getLogger(__name__)
+# Discord allows a channel to be renamed twice per 10 minutes
+CHANNEL_RENAME_INTERVAL = 310
 
 
 class ServerStatsCog(commands.Cog):
     def __init__(self, bot: discord.ext.commands.bot.Bot):
         self.bot = bot
         self.guild = None
+        self._pending_names = {}
+        self._rename_event = asyncio.Event()
+        # Role ID -> member count, recounted every stats update and kept up
+        # to date from member events in between
+        self._role_member_counts = {}
 
     @commands.Cog.listener()
     async def on_member_join(self, _):
         await self.update_member_count()
 
     @commands.Cog.listener()
-    async def on_member_remove(self, _):
+    async def on_member_remove(self, member):
         await self.update_member_count()
+        if self.adjust_role_member_counts(member, None):
+            await self.update_role_counts()
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        if self.adjust_role_member_counts(before, after):
+            await self.update_role_counts()
 
     def cog_load(self) -> None:
         self.bot.loop.create_task(self.update_server_stats())
+        self.bot.loop.create_task(self.rename_channels_task())
+
+    def queue_channel_rename(self, channel_id: int, name: str):
+        # Only the latest name per channel is kept until the next flush
+        self._pending_names[channel_id] = name
+        self._rename_event.set()
+
+    def adjust_role_member_counts(self, before, after) -> bool:
+        """Apply a member's stats role changes, returns whether any changed"""
+        if not self._role_member_counts:
+            return False
+        changed = False
+        for role_id in self._role_member_counts:
+            had_role = before.get_role(role_id) is not None
+            has_role = (
+                after is not None and after.get_role(role_id) is not None
+            )
+            if had_role != has_role:
+                self._role_member_counts[role_id] += 1 if has_role else -1
+                changed = True
+        return changed
 
     async def update_member_count(self):
         logger.debug("Updating Member Count...")
         self.guild = self.guild or self.bot.get_guild(GUILD_ID)
         logger.debug(f"Guild: {self.guild}")
-        channel = await self.bot.fetch_channel(MEMBERS_COUNT_CHANNEL_ID)
-        logger.debug(f"Member Count Channel: {channel}")
-        member_count = len(self.guild.members)
+        # Kept current by discord.py from the gateway
+        member_count = self.guild.member_count
         logger.debug(f"Member Count: {member_count}")
-        await channel.edit(name=f"🔹┇{member_count}︲members")
-        logger.debug("Member Count Channel Updated!")
+        self.queue_channel_rename(
+            MEMBERS_COUNT_CHANNEL_ID, f"🔹┇{member_count}︲members"
+        )
 
     async def update_boost_count(self):
         logger.debug("Updating Boost Count...")
         self.guild = self.guild or self.bot.get_guild(GUILD_ID)
         logger.debug(f"Guild: {self.guild}")
-        channel = await self.bot.fetch_channel(BOOSTS_COUNT_CHANNEL_ID)
-        logger.debug(f"Boost Count Channel: {channel}")
         logger.debug(f"Boost Count: {self.guild.premium_subscription_count}")
-        await channel.edit(
-            name=f"🔸┇{self.guild.premium_subscription_count}︲boosts"
+        self.queue_channel_rename(
+            BOOSTS_COUNT_CHANNEL_ID,
+            f"🔸┇{self.guild.premium_subscription_count}︲boosts",
         )
-        logger.debug("Boost Count Channel Updated!")
+
+    def count_role_members(self):
+        """Recount stats role members, correcting any missed member events"""
+        logger.debug("Counting Role Members...")
+        self.guild = self.guild or self.bot.get_guild(GUILD_ID)
+        for role_id in (MODDER_ROLE_ID, MAPPER_ROLE_ID):
+            self._role_member_counts[role_id] = len(
+                self.guild.get_role(role_id).members
+            )
 
     async def update_role_counts(self):
         logger.debug("Updating Role Counts...")
         self.guild = self.guild or self.bot.get_guild(GUILD_ID)
         logger.debug(f"Guild: {self.guild}")
-        modder_channel = await self.bot.fetch_channel(MODDER_STATS_CHANNEL_ID)
-        logger.debug(f"Modder Count Channel: {modder_channel}")
-        modder_role = self.guild.get_role(MODDER_ROLE_ID)
-        logger.debug(f"Modder Role: {modder_role}")
-        modder_member_count = len(modder_role.members)
+        if not self._role_member_counts:
+            self.count_role_members()
+        modder_member_count = self._role_member_counts[MODDER_ROLE_ID]
         logger.debug(f"Modder Member Count: {modder_member_count}")
-        await modder_channel.edit(name=f"🔸┇{modder_member_count}︲modders")
-        logger.debug("Modder Count Channel Updated!")
-
-        mapper_channel = await self.bot.fetch_channel(MAPPER_STATS_CHANNEL_ID)
-        logger.debug("Getting Mapper Role...")
-        mapper_role = self.guild.get_role(MAPPER_ROLE_ID)
-        logger.debug(f"Mapper Role: {mapper_role}")
-        mapper_member_count = len(mapper_role.members)
+        self.queue_channel_rename(
+            MODDER_STATS_CHANNEL_ID, f"🔸┇{modder_member_count}︲modders"
+        )
+
+        mapper_member_count = self._role_member_counts[MAPPER_ROLE_ID]
         logger.debug(f"Mapper Member Count: {mapper_member_count}")
-        await mapper_channel.edit(name=f"🔹┇{mapper_member_count}︲mappers")
-        logger.debug("Mapper Count Channel Updated!")
+        self.queue_channel_rename(
+            MAPPER_STATS_CHANNEL_ID, f"🔹┇{mapper_member_count}︲mappers"
+        )
+
+    async def rename_channels_task(self):
+        while True:
+            await self._rename_event.wait()
+            self._rename_event.clear()
+            pending, self._pending_names = self._pending_names, {}
+            for channel_id, name in pending.items():
+                try:
+                    channel = self.bot.get_channel(
+                        channel_id
+                    ) or await self.bot.fetch_channel(channel_id)
+                    if channel.name == name:
+                        logger.debug(f"Channel {channel} already up to date.")
+                        continue
+                    await channel.edit(name=name)
+                except discord.HTTPException:
+                    logger.exception(f"Failed to rename channel {channel_id}")
+                    # Retry on the next flush unless a newer name was queued
+                    self._pending_names.setdefault(channel_id, name)
+                    self._rename_event.set()
+                    continue
+                logger.debug(f"Channel renamed to {name}!")
+            # Anything queued meanwhile is flushed with its latest value
+            logger.debug(
+                f"Stats channels renamed. Sleeping "
+                f"{CHANNEL_RENAME_INTERVAL} seconds..."
+            )
+            await asyncio.sleep(CHANNEL_RENAME_INTERVAL)
 
     async def update_server_stats(self):
         await asyncio.sleep(60)
         logger.debug("Updating Server Stats...")
         await self.update_member_count()
-        await self.update_role_counts()
         while True:
+            self.count_role_members()
+            await self.update_role_counts()
             await self.update_boost_count()
             logger.debug("Server Stats updated! Sleeping 10 minutes...")
             await asyncio.sleep(600)
@@ -1,4 +1,6 @@
 import logging
+import os
+import pathlib
 import re
 from datetime import datetime, timezone
 
@@ -11,6 +13,18 @@ from ..constants import GUILD_ID, STARBOARD_TEXT_CHANNEL_ID
 logger = logging.getLogger(__name__)
 channel_id_pattern = re.compile(rf"discord\.com/channels/{GUILD_ID}/\d+/(\d+)")
 REACTION_LIMIT = 5
+# Stars on older messages are effectively settled, no need to dedupe them
+STARBOARD_HISTORY_LIMIT = 5000
+# Starboard embeds alternate between these colours
+STARBOARD_COLOURS = (discord.Colour(16769024), discord.Colour(3375061))
+JUMP_FIELD_NAME = "\u200b"
+JUMP_FIELD_VALUE = "**[Click to jump to message!]({})**"
+# Saved "<starboard message ID> <starred message ID>" lines. Only useful
+# across restarts when this points at persistent storage; the default is
+# relative to the working directory, which deployment.yaml doesn't persist.
+STARBOARD_IDS_PATH = pathlib.Path(
+    os.getenv("STARBOARD_IDS_PATH", "starboard_ids.log")
+)
 
 
 class StarboardCog(commands.Cog):
@@ -22,12 +36,23 @@ class StarboardCog(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         logger.debug("StarboardCog On Ready!")
+        latest_starboard_id = self.load_starred_message_ids()
         logger.debug("Loading Starboard Messages...")
         channel: discord.TextChannel = self.bot.get_channel(
             STARBOARD_TEXT_CHANNEL_ID
         )
         logger.debug(f"Found Starboard Channel: {channel}")
-        async for message in channel.history(limit=None):
+        # Only messages posted since the last saved one need scanning
+        after = (
+            discord.Object(id=latest_starboard_id)
+            if latest_starboard_id is not None
+            else None
+        )
+        found_ids = []
+        # Newest first, so the first message seen is the latest entry
+        async for message in channel.history(
+            limit=STARBOARD_HISTORY_LIMIT, after=after, oldest_first=False
+        ):
             if self._last_message is None:
                 self._last_message = message
                 logger.debug(f"Last Message: {self._last_message}")
@@ -36,56 +61,87 @@ class StarboardCog(commands.Cog):
                     f"Message in Starboard channel missing embeds: {message}"
                 )
                 continue
-            found = channel_id_pattern.findall(
+            match = channel_id_pattern.search(
                 message.embeds[0].fields[0].value
             )
-            if not found:
+            if match is None:
                 logger.warning(
                     f"Message in Starboard channel, unable to parse related "
                     f"channel id. Message: {message}"
                 )
                 continue
-            logger.debug(f"Found Existing Starboard Message ID: {found[0]}")
-            self._starred_message_ids.add(int(found[0]))
+            logger.debug(
+                "Found Existing Starboard Message ID: %s", match.group(1)
+            )
+            found_ids.append((message.id, int(match.group(1))))
+        self.save_starred_message_ids(found_ids)
+        if self._last_message is None:
+            async for message in channel.history(limit=1):
+                self._last_message = message
         logger.debug(f"Starred Message IDs: {self._starred_message_ids}")
 
+    def load_starred_message_ids(self):
+        """Load saved IDs, returns the newest starboard message ID"""
+        if not STARBOARD_IDS_PATH.exists():
+            return None
+        latest_starboard_id = None
+        for line in STARBOARD_IDS_PATH.read_text().splitlines():
+            try:
+                starboard_id, message_id = map(int, line.split())
+            except ValueError:
+                # e.g. a line cut short by a crash while appending
+                logger.warning("Skipping malformed saved ID line: %r", line)
+                continue
+            self._starred_message_ids.add(message_id)
+            latest_starboard_id = max(latest_starboard_id or 0, starboard_id)
+        logger.debug(
+            "Loaded %d saved Starred Message IDs",
+            len(self._starred_message_ids),
+        )
+        return latest_starboard_id
+
+    def save_starred_message_ids(self, ids):
+        """Save (starboard message ID, starred message ID) pairs"""
+        if not ids:
+            return
+        self._starred_message_ids.update(message_id for _, message_id in ids)
+        with STARBOARD_IDS_PATH.open("a") as f:
+            f.writelines(
+                f"{starboard_id} {message_id}\n"
+                for starboard_id, message_id in ids
+            )
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(
         self, payload: discord.RawReactionActionEvent
     ):
+        if payload.emoji.name != "⭐":
+            return
         logger.debug(
-            f"Payload Received. Channel ID: {payload.channel_id}, "
-            f"Member ID: {payload.member.id}, "
-            f"Message ID: {payload.message_id}, Emoji: {payload.emoji.name}"
+            "Payload Received. Channel ID: %s, User ID: %s, Message ID: %s",
+            payload.channel_id,
+            payload.user_id,
+            payload.message_id,
         )
         if payload.channel_id == STARBOARD_TEXT_CHANNEL_ID:
             logger.debug("Reaction in Starboard channel. Ignoring.")
             return
-        if payload.member.id == self.bot.user.id:
-            logger.debug("Reaction is from self. Ignoring.")
+        if payload.member is None or payload.member.bot:
+            logger.debug("Reaction is from a bot or a DM. Ignoring.")
             return
         if payload.message_id in self._starred_message_ids:
             logger.debug("Already on starboard. Ignoring")
             return
-        if payload.emoji.name != "⭐":
-            logger.debug("Reaction not ⭐. Ignoring.")
-            return
 
         # Reaction is star, and not already on starboard. Check for eligibility
         channel: discord.TextChannel = self.bot.get_channel(payload.channel_id)
         message: discord.Message = await channel.fetch_message(
             payload.message_id
         )
-        count = 0
-        for reaction in message.reactions:
-            logger.debug(f"Reaction: {reaction}, Emoji: {reaction.emoji}")
-            if reaction.emoji == "⭐":
-                count += 1
-                logger.debug(f"Found ⭐ reaction. Count: {count}")
-                if count >= REACTION_LIMIT:
-                    logger.debug("Enough star reactions for starboard.")
-                    break
-        else:
+        if not any(
+            reaction.emoji == "⭐" and reaction.count >= REACTION_LIMIT
+            for reaction in message.reactions
+        ):
             logger.debug("Not enough star reactions")
             return
 
@@ -93,38 +149,32 @@ class StarboardCog(commands.Cog):
         starboard_channel: discord.TextChannel = self.bot.get_channel(
             STARBOARD_TEXT_CHANNEL_ID
         )
-        avatar_url = str(
-            payload.member.avatar_url_as(static_format="png", size=128)
+        colour = (
+            STARBOARD_COLOURS[1]
+            if self._last_message.embeds[0].colour == STARBOARD_COLOURS[0]
+            else STARBOARD_COLOURS[0]
+        )
+        embed = discord.Embed(
+            colour=colour,
+            type="rich",
+            description=message.clean_content,
+            timestamp=datetime.now(timezone.utc),
+        )
+        embed.set_author(
+            name=str(payload.member),
+            icon_url=payload.member.display_avatar.replace(
+                static_format="png", size=128
+            ).url,
+        )
+        embed.add_field(
+            name=JUMP_FIELD_NAME,
+            value=JUMP_FIELD_VALUE.format(message.jump_url),
+            inline=False,
         )
-        embed = {
-            "author": {
-                "name": str(payload.member),
-                "icon_url": avatar_url,
-                "proxy_icon_url": avatar_url.replace("?size=128", ""),
-            },
-            "fields": [
-                {
-                    "name": "\u200b",
-                    "value": f"**[Click to jump to message!]"
-                    f"({message.jump_url})**",
-                    "inline": False,
-                }
-            ],
-            "color": 3375061
-            if self._last_message.embeds[0].color == 16769024
-            else 16769024,
-            "timestamp": datetime.utcnow()
-            .replace(tzinfo=timezone.utc)
-            .isoformat(),
-            "type": "rich",
-            "description": message.clean_content,
-        }
-        logger.debug(f"Embed: {embed}")
         self._starred_message_ids.add(message.id)
         logger.debug("Creating Starboard Message...")
-        self._last_message = await starboard_channel.send(
-            embed=discord.Embed.from_dict(embed)
-        )
+        self._last_message = await starboard_channel.send(embed=embed)
+        self.save_starred_message_ids([(self._last_message.id, message.id)])
         logger.debug("Adding Star reaction to new Starboard Message...")
         await self._last_message.add_reaction("⭐")
         logger.debug("Starboard Message Election complete!")
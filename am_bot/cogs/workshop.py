@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from discord.ext import commands
 
@@ -12,6 +12,8 @@ from ..constants import (
 
 
 logger = logging.getLogger(__name__)
+# Discord bulk deletes at most 100 messages per request
+PURGE_BATCH_SIZE = 100
 
 
 class WorkshopCog(commands.Cog):
@@ -24,8 +26,10 @@ class WorkshopCog(commands.Cog):
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         logger.debug(
-            f"Voice state activity:: Member: {member} "
-            f"Before: {before}, After: {after}"
+            "Voice state activity:: Member: %s Before: %s, After: %s",
+            member,
+            before,
+            after,
         )
         if (
             before.channel is None
@@ -34,18 +38,19 @@ class WorkshopCog(commands.Cog):
             after.channel is not None
             and after.channel.id == WORKSHOP_VOICE_CHANNEL_ID
         ):
-            # Add role for one-time join
             logger.debug(
                 "Member joined AMC Workshop Voice Channel. "
-                "Adding AMC Workshop role..."
+                "Adding AMC Workshop role and adding member to text chat..."
             )
-            await member.add_roles(member.guild.get_role(WORKSHOP_ROLE_ID))
+            channel = member.guild.get_channel(WORKSHOP_TEXT_CHANNEL_ID)
             # Add member overwrite permissions to view text channel
-            logger.debug("Adding member to text chat...")
-            channel = member.guild.get_channel(
-                channel_id=WORKSHOP_TEXT_CHANNEL_ID
-            )
-            await channel.set_permissions(member, view_channel=True)
+            updates = [channel.set_permissions(member, view_channel=True)]
+            # Add role for one-time join, repeat visitors already have it
+            if member.get_role(WORKSHOP_ROLE_ID) is None:
+                updates.append(
+                    member.add_roles(member.guild.get_role(WORKSHOP_ROLE_ID))
+                )
+            await asyncio.gather(*updates)
         elif (
             before.channel is not None
             and before.channel.id == WORKSHOP_VOICE_CHANNEL_ID
@@ -58,9 +63,7 @@ class WorkshopCog(commands.Cog):
                 "Member has left AMC Workshop Voice Channel. "
                 "Removing member from text chat..."
             )
-            channel = member.guild.get_channel(
-                channel_id=WORKSHOP_TEXT_CHANNEL_ID
-            )
+            channel = member.guild.get_channel(WORKSHOP_TEXT_CHANNEL_ID)
             await channel.set_permissions(member, overwrite=None)
 
     async def text_cleanup_task(self):
@@ -68,11 +71,20 @@ class WorkshopCog(commands.Cog):
         logger.debug(
             "AMC Workshop Text Cleanup Task Starting. Fetching Channel..."
         )
-        channel = await self.bot.fetch_channel(WORKSHOP_TEXT_CHANNEL_ID)
+        channel = self.bot.get_channel(
+            WORKSHOP_TEXT_CHANNEL_ID
+        ) or await self.bot.fetch_channel(WORKSHOP_TEXT_CHANNEL_ID)
         logger.debug(f"Channel Fetched: {channel}")
         while True:
-            purge_time = datetime.utcnow() - timedelta(days=1)
+            purge_time = datetime.now(timezone.utc) - timedelta(days=1)
             logger.debug(f"Purging messages older than: {purge_time}")
-            await channel.purge(before=purge_time)
-            logger.debug("Sleeping 10 minutes...")
-            await asyncio.sleep(600)
+            # One bulk delete per call, keep going until the backlog is gone
+            while True:
+                deleted = await channel.purge(
+                    limit=PURGE_BATCH_SIZE, before=purge_time
+                )
+                logger.debug(f"Purged {len(deleted)} messages.")
+                if len(deleted) < PURGE_BATCH_SIZE:
+                    break
+            logger.debug("Sleeping 1 hour...")
+            await asyncio.sleep(3600)
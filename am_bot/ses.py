@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import logging
 
 import boto3
@@ -8,13 +10,16 @@ logger = logging.getLogger(__name__)
 
 SENDER = "no-reply@arkmodding.net"
 AWS_REGION = "us-west-1"
+# Created once at import, on the event loop thread, since building a client
+# from boto3's default session isn't thread-safe. Using it from the executor
+# threads is.
+_SES_CLIENT = boto3.client("ses", region_name=AWS_REGION)
 
 
 def send_email(to: str, subject: str, body_txt: str, body_html: str):
     logger.info(f"Sending Email to {to}...")
-    client = boto3.client("ses", region_name=AWS_REGION)
     try:
-        response = client.send_email(
+        response = _SES_CLIENT.send_email(
             Destination={"ToAddresses": [to]},
             Message={
                 "Body": {
@@ -29,3 +34,19 @@ def send_email(to: str, subject: str, body_txt: str, body_html: str):
         logger.warning(e.response["Error"]["Message"])
     else:
         logger.info(f"Email Sent! Response: {response}")
+
+
+async def send_email_async(
+    to: str, subject: str, body_txt: str, body_html: str
+):
+    # boto3 is blocking, keep it off the event loop
+    await asyncio.get_running_loop().run_in_executor(
+        None,
+        functools.partial(
+            send_email,
+            to,
+            subject=subject,
+            body_txt=body_txt,
+            body_html=body_html,
+        ),
+    )